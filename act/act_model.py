@@ -32,8 +32,8 @@ from .core.battery_model import BatteryModel
 from .core.pcb_model import DEFAULT_PCB_MODEL_FILE, PCBModel
 from .core.connector_model import ConnectorModel, DEFAULT_CONNECTOR_MODEL_FILE
 from .core.diode_model import DiodeModel, DEFAULT_DIODE_MODEL_FILE
-from .core.switch_model import SwitchModel, DEFAULT_SWITCH_MODEL_FILE
-from .core.resistor_model import ResistorModel, DEFAULT_RESISTOR_MODEL_FILE
+from .core.switch_model import get_switch_model, DEFAULT_SWITCH_MODEL_FILE
+from .core.resistor_model import get_resistor_model, DEFAULT_RESISTOR_MODEL_FILE
 from .core.inductor_model import InductorModel, DEFAULT_INDUCTOR_MODEL_FILE
 from .core.other_model import OtherModel, DEFAULT_OTHER_MODEL_FILE
 from .core.active_model import ActiveModel, DEFAULT_ACTIVE_MODEL_FILE
@@ -104,8 +104,8 @@ class ACTModel:
         self.pcb_model = PCBModel(model_file=pcb_config)
         self.connector_model = ConnectorModel(model_file=connector_config) 
         self.diode_model = DiodeModel(model_file=diode_config)
-        self.resistor_model = ResistorModel(model_file=resistor_config)
-        self.switch_model = SwitchModel(model_file=switch_config)
+        self.resistor_model = get_resistor_model(model_file=resistor_config)
+        self.switch_model = get_switch_model(model_file=switch_config)
         self.inductor_model = InductorModel(model_file=inductor_config)
         self.other_model = OtherModel(model_file=other_config)
         self.active_model = ActiveModel(model_file=active_config)
@@ -419,21 +419,25 @@ def main():
 
     model_args, query_args = get_clean_args(args)
 
-    # initialize the model
-    model = ACTModel(**model_args)
-
-    # if a bill of materials file is specified, use that instead of the cl arg values
-    if args.materials is not None:
-        with open(args.materials) as handle:
-            bom = BOM(
-                **yaml.load(handle, Loader=yaml.FullLoader),
-                file=args.materials,
-                material_type=model.materials_model.MaterialType,
-            )
-            query_args.update(bom=bom)
+    try:
+        # initialize the model
+        model = ACTModel(**model_args)
+
+        # if a bill of materials file is specified, use that instead of the cl arg values
+        if args.materials is not None:
+            with open(args.materials) as handle:
+                bom = BOM(
+                    **yaml.load(handle, Loader=yaml.FullLoader),
+                    file=args.materials,
+                    material_type=model.materials_model.MaterialType,
+                )
+                query_args.update(bom=bom)
 
-    # query the model for the carbon estimate
-    carbon = model.get_carbon(**query_args)
+        # query the model for the carbon estimate
+        carbon = model.get_carbon(**query_args)
+    except ModelConfigError as e:
+        log.error(e)
+        sys.exit(1)
     log.info(f"Total carbon for this system configuration: {carbon.total()}")
 
     log.info("ACT done executing...")
@@ -0,0 +1,191 @@
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import functools
+import os
+import threading
+
+import numpy as np
+
+from .common import ModelConfigError
+from .logger import log
+from .units import _q
+from .utils import load_yaml
+from enum import Enum
+
+
+# Shared model instances keyed by (model class, absolute model file path), each stored with the
+# modification time and size of the file it was built from. Holds one instance per file.
+_shared_models = {}
+_shared_models_lock = threading.Lock()
+
+
+class LazyLoadMixin:
+    """
+    Defers loading a model file until the model is first used. Subclasses implement _load and
+    call _ensure_loaded before reading anything _load builds.
+    """
+
+    # Guards lazy loading. Held on the class so instances stay picklable and copyable.
+    _load_lock = threading.Lock()
+
+    # Whether _load has run for this instance
+    _loaded = False
+
+    def _ensure_loaded(self):
+        """Loads the model file and builds the factor tables if that has not happened yet."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+
+    def _load(self):
+        """Loads the model file and builds the factor tables."""
+        raise NotImplementedError
+
+
+class FactorTable(dict):
+    """
+    A dict of emission factors that counts its own mutations, so a model can tell when the float
+    tables it derives from the factors need rebuilding.
+    """
+
+    # Incremented on every mutation
+    version = 0
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),), self.__dict__)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self.version += 1
+        return self
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self.version += 1
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self.version += 1
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+
+@functools.lru_cache(maxsize=None)
+def _value_map(enum_cls: type[Enum]) -> dict:
+    """Reverse map from each enum value to its member, built once per enum."""
+    return {t.value: t for t in enum_cls}
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_positions(enum_cls: type[Enum]) -> dict:
+    """Position of each member in enum definition order, keyed by member and by value, built once per enum."""
+    positions = {t: i for i, t in enumerate(enum_cls)}
+    positions.update({t.value: i for t, i in list(positions.items())})
+    return positions
+
+
+def enum_indices(enum_cls: type[Enum], types) -> np.ndarray:
+    """
+    Maps component types to their positions in enum definition order, for gathering from the
+    per-type arrays the get_carbon_batch methods build.
+
+    Args:
+        enum_cls (type[Enum]): The enum the types belong to.
+        types (Sequence): Each row's type, as enum_cls members or their string values.
+
+    Returns:
+        np.ndarray: The position of each row's type.
+
+    Raises:
+        KeyError: If a row's type is not a member or value of enum_cls
+    """
+    positions = _enum_positions(enum_cls)
+    return np.fromiter((positions[t] for t in types), dtype=np.intp, count=len(types))
+
+
+def load_emission_factors(
+    model_file: str,
+    enum_cls: type[Enum],
+    *,
+    required: Enum = None,
+) -> dict:
+    """
+    Loads a model file that maps enum values to emission factors. Unknown keys are warned
+    about and skipped.
+
+    Args:
+        model_file (str): The path to the model file.
+        enum_cls (type[Enum]): The enum whose values key the model file entries.
+        required (Enum, optional): A member the model file must define. Defaults to None.
+
+    Returns:
+        dict: A new mapping of enum_cls member to emission factor, which the caller may mutate.
+
+    Raises:
+        ModelConfigError: If the model file has no known entries or lacks the required member
+    """
+    value_map = _value_map(enum_cls)
+
+    emission_factors = {}
+    for key, factor in load_yaml(model_file).items():
+        member = value_map.get(key)
+        if member is None:
+            log.warn(f"Unknown {enum_cls.__name__} '{key}' in {model_file}, skipping.")
+            continue
+        emission_factors[member] = _q(factor)
+
+    if not emission_factors:
+        raise ModelConfigError(f"No {enum_cls.__name__} emission factors found in {model_file}.")
+    if required is not None and required not in emission_factors:
+        raise ModelConfigError(f"No {required} emission factor found in {model_file}.")
+    return emission_factors
+
+
+def shared_model(model_cls: type, model_file: str):
+    """
+    Returns a shared model_cls instance for a model file, constructing it only the first time the
+    file is seen or after its modification time or size changes. A rebuilt instance replaces the
+    one it supersedes.
+
+    Args:
+        model_cls (type): The model class, constructed from the model file path.
+        model_file (str): The path to the model file.
+
+    Returns:
+        The model instance. It is shared between callers and must not be mutated.
+    """
+    path = os.path.abspath(model_file)
+    stat = os.stat(path)
+    source = (stat.st_mtime_ns, stat.st_size)
+    key = (model_cls, path)
+    with _shared_models_lock:
+        entry = _shared_models.get(key)
+        if entry is None or entry[0] != source:
+            entry = (source, model_cls(path))
+            _shared_models[key] = entry
+    return entry[1]
@@ -3,14 +3,18 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import functools
 from enum import Enum
 
-import yaml
+import numpy as np
+
 from .units import *
+from .units import _q
 
 from .carbon import Carbon, SourceType
 from .common import ACT_ROOT, EnergyLocation
-from .utils import load_ci_model
+from ._model_loader import FactorTable, _value_map, enum_indices
+from .utils import load_ci_model, load_yaml
 
 
 class CapacitorType(Enum):
@@ -52,6 +56,28 @@ DEFAULT_CARBON_PER_CAPACITOR = 300 * g
 DEFAULT_CP_CONFIG = f"{ACT_ROOT}/models/passives/capacitors.yaml"
 
 
+"""DEFAULT_CARBON_PER_CAPACITOR as a plain kg CO2e magnitude."""
+_DEFAULT_CARBON_KG = DEFAULT_CARBON_PER_CAPACITOR.m_as("kg")
+
+"""Maximum number of get_carbon results memoized per CapacitorModel instance."""
+_CARBON_MEMO_SIZE = 4096
+
+
+def _default_carbon(ci, weight, n_caps):
+    """Fallback calculation in kg CO2e for capacitor types without a model entry."""
+    return _DEFAULT_CARBON_KG * n_caps
+
+
+def _energy_based_carbon(energy_per_kg, ci_mag, ci, weight, n_caps):
+    """Energy-based calculation in kg CO2e: energy_per_kg * weight * quantity * carbon intensity."""
+    return energy_per_kg * weight.m_as("kg") * n_caps * ci_mag[ci]
+
+
+def _package_based_carbon(emission_per_cap, ci, weight, n_caps):
+    """Package-based calculation in kg CO2e: emission_factor_per_package * quantity."""
+    return emission_per_cap * n_caps
+
+
 class CapacitorModel:
     """
     A model for estimating carbon emissions from capacitors.
@@ -64,7 +90,7 @@ class CapacitorModel:
 
     Attributes:
         capacitor_model (dict): A dictionary mapping CapacitorType to units of carbon per weight.
-        ci_model (dict): A dictionary mapping EnergyLocation to carbon intensity values.
+        ci_model (dict): A mapping of EnergyLocation to carbon intensity values, shared between instances and not to be mutated.
         package_model (dict): Package-based model (kg CO2e per capacitor)
     """
 
@@ -76,12 +102,11 @@ class CapacitorModel:
         Args:
             model_file (str, optional): Capacitor model file to load. Defaults to DEFAULT_CP_CONFIG.
         """
-        with open(model_file) as f:
-            model_data = yaml.load(f, Loader=yaml.FullLoader)
+        model_data = load_yaml(model_file)
         
         # Separate energy-based and package-based models
-        self.capacitor_model: dict[CapacitorType, pint.Quantity] = {}
-        self.package_model: dict[CapacitorType, pint.Quantity] = {}
+        self._capacitor_model: dict[CapacitorType, pint.Quantity] = FactorTable()
+        self._package_model: dict[CapacitorType, pint.Quantity] = FactorTable()
         
         for key, value in model_data.items():
             try:
@@ -89,19 +114,103 @@ class CapacitorModel:
                 
                 # Energy-based types (MJ/kg)
                 if cap_type in [CapacitorType.MLCC, CapacitorType.TEC, CapacitorType.GENERIC]:
-                    self.capacitor_model[cap_type] = units(value)
+                    self._capacitor_model[cap_type] = _q(value)
                 # Package-based types (kg CO2e)
                 else:
-                    self.package_model[cap_type] = units(value)
+                    self._package_model[cap_type] = _q(value)
             except ValueError:
                 # Skip unknown types
                 pass
         self.ci_model = load_ci_model()
 
+        # Plain carbon intensity magnitudes (kg CO2e / kWh) for the energy-based fast path
+        self._ci_mag = {k: v.m_as("kg/kWh") for k, v in self.ci_model.items()}
+
+        # Per-instance memo of get_carbon results in kg CO2e; BOMs repeat the same capacitor rows
+        # many times. Left out of copy and pickle state, see __getstate__.
+        self._carbon_memo = {}
+        self._build_tables()
+
+    @property
+    def capacitor_model(self):
+        """Mapping of energy-based CapacitorType to energy per weight."""
+        return self._capacitor_model
+
+    @capacitor_model.setter
+    def capacitor_model(self, capacitor_model):
+        self._capacitor_model = FactorTable(capacitor_model)
+        self._build_tables()
+
+    @property
+    def package_model(self):
+        """Mapping of package-based CapacitorType to kg CO2e per capacitor."""
+        return self._package_model
+
+    @package_model.setter
+    def package_model(self, package_model):
+        self._package_model = FactorTable(package_model)
+        self._build_tables()
+
+    def _tables_changed(self):
+        """Whether capacitor_model or package_model changed since the factor tables were built."""
+        return self._capacitor_model.version + self._package_model.version != self._tables_version
+
+    def _build_tables(self):
+        """Builds the float factor tables and dispatch table from capacitor_model and package_model."""
+        # Plain energy magnitudes (kWh / kg) for the energy-based fast path
+        self._energy_per_kg_mag = {
+            t: e.m_as("kWh/kg") for t, e in self._capacitor_model.items()
+        }
+
+        # Per-type arrays indexed by position in CapacitorType, for get_carbon_batch.
+        # Package-based and fallback types carry a fixed kg CO2e per capacitor, energy-based
+        # types carry kWh / kg to be scaled by weight and carbon intensity.
+        self._fixed_array = np.array(
+            [
+                0.0 if t in self._capacitor_model
+                else self._package_model[t].m_as("kg") if t in self._package_model
+                else _DEFAULT_CARBON_KG
+                for t in CapacitorType
+            ],
+            dtype=np.float64,
+        )
+        self._energy_array = np.array(
+            [self._energy_per_kg_mag.get(t, 0.0) for t in CapacitorType],
+            dtype=np.float64,
+        )
+
+        # Single dispatch table from capacitor type to its calculation, in kg CO2e.
+        # Package-based entries are added last so they take precedence, as in the original branch order.
+        # Entries are partials over module-level functions so the model stays picklable.
+        self._dispatch = {}
+        for cap_type, energy_per_kg in self._energy_per_kg_mag.items():
+            self._dispatch[cap_type] = functools.partial(
+                _energy_based_carbon, energy_per_kg, self._ci_mag
+            )
+        for cap_type, emission_per_cap in self._package_model.items():
+            self._dispatch[cap_type] = functools.partial(
+                _package_based_carbon, emission_per_cap.m_as("kg")
+            )
+
+        # Memoized results were computed from the previous tables
+        self._carbon_memo.clear()
+        self._tables_version = self._capacitor_model.version + self._package_model.version
+
+    def __getstate__(self):
+        """Copy and pickle state, without the get_carbon memo."""
+        state = self.__dict__.copy()
+        del state["_carbon_memo"]
+        return state
+
+    def __setstate__(self, state):
+        """Restores copied or pickled state with an empty get_carbon memo."""
+        self.__dict__.update(state)
+        self._carbon_memo = {}
+
     def get_carbon(
         self,
         ci: EnergyLocation = EnergyLocation.JAPAN,
-        ctype: CapacitorType = CapacitorType.GENERIC,
+        ctype: CapacitorType | str = CapacitorType.GENERIC,
         weight: pint.Quantity = DEFAULT_CAPACITOR_WEIGHT,
         n_caps: int = 1,
     ) -> Carbon:
@@ -111,29 +220,70 @@ class CapacitorModel:
         Automatically selects calculation method:
         - Package-based: If ctype is 0201/0402/0603/0805 (uses package emission factors)
         - Energy-based: If ctype is mlcc/tec/generic (uses weight * energy * carbon intensity)
+        - Fallback: DEFAULT_CARBON_PER_CAPACITOR per capacitor for types missing from the model file
 
         Args:
             ci (EnergyLocation, optional): Carbon intensity per manufacturing energy. Defaults to EnergyLocation.JAPAN.
-            ctype (CapacitorType, optional): The capacitor type. Defaults to CapacitorType.GENERIC.
+            ctype (CapacitorType | str, optional): The capacitor type, as a CapacitorType or its string value. Defaults to CapacitorType.GENERIC.
             weight (pint.Quantity, optional): Weight of the capacitor. Defaults to DEFAULT_CAPACITOR_WEIGHT.
             n_caps (int, optional): Number of capacitors. Defaults to 1.
 
         Returns:
             Carbon: A carbon object that encodes the emissions cost of manufacturing.
         """
-        # Method 1: Package-based calculation (for IoT components)
-        if ctype in self.package_model:
-            emission_per_cap = self.package_model[ctype]
-            total_carbon = emission_per_cap * n_caps
-            return Carbon(total_carbon, SourceType.CAPACITOR)
-        
-        # Method 2: Energy-based calculation (legacy)
-        elif ctype in self.capacitor_model:
-            energy_per_kg = self.capacitor_model[ctype]
-            carbon_intensity = self.ci_model[ci]
-            total_carbon = energy_per_kg * weight * n_caps * carbon_intensity
-            return Carbon(total_carbon, SourceType.CAPACITOR)
-        
-        # Fallback: Use default
-        else:
-            return Carbon(DEFAULT_CARBON_PER_CAPACITOR * n_caps, SourceType.CAPACITOR)
+        if self._tables_changed():
+            self._build_tables()
+        ctype = _value_map(CapacitorType).get(ctype, ctype)
+
+        try:
+            key = (ci, ctype, weight.magnitude, weight.units, n_caps)
+            total_carbon = self._carbon_memo.get(key)
+        except (AttributeError, TypeError):
+            # Weights that are not quantities, e.g. None for package-based types, and unhashable
+            # arguments, e.g. array-valued weights, are computed without the memo
+            return Carbon(
+                units.Quantity(self._compute_carbon(ci, ctype, weight, n_caps), "kg"),
+                SourceType.CAPACITOR,
+            )
+
+        if total_carbon is None:
+            total_carbon = self._compute_carbon(ci, ctype, weight, n_caps)
+            if len(self._carbon_memo) >= _CARBON_MEMO_SIZE:
+                self._carbon_memo.clear()
+            self._carbon_memo[key] = total_carbon
+        return Carbon(units.Quantity(total_carbon, "kg"), SourceType.CAPACITOR)
+
+    def _compute_carbon(self, ci, ctype, weight, n_caps):
+        """Computes the carbon emissions in kg CO2e for get_carbon."""
+        return self._dispatch.get(ctype, _default_carbon)(ci, weight, n_caps)
+
+    def get_carbon_batch(
+        self,
+        types: list,
+        weights_kg: np.ndarray,
+        counts: np.ndarray,
+        ci: EnergyLocation = EnergyLocation.JAPAN,
+    ) -> Carbon:
+        """
+        Get the total carbon emissions cost for many capacitor rows at once.
+
+        Each row uses the same calculation method that get_carbon selects for its type.
+
+        Args:
+            types (list): The type of each row, as CapacitorType members or their string values.
+            weights_kg (np.ndarray): Weight of a single capacitor in each row, in kg. Only used by energy-based types.
+            counts (np.ndarray): Number of capacitors in each row.
+            ci (EnergyLocation, optional): Carbon intensity per manufacturing energy. Defaults to EnergyLocation.JAPAN.
+
+        Returns:
+            Carbon: A carbon object that encodes the summed emissions cost of manufacturing.
+        """
+        if self._tables_changed():
+            self._build_tables()
+        idx = enum_indices(CapacitorType, types)
+        per_cap = (
+            self._fixed_array[idx]
+            + self._energy_array[idx] * np.asarray(weights_kg, dtype=np.float64) * self._ci_mag[ci]
+        )
+        total = float((per_cap * np.asarray(counts)).sum())
+        return Carbon(units.Quantity(total, "kg"), SourceType.CAPACITOR)
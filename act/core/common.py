@@ -14,6 +14,12 @@ Root directory of the project.
 ACT_ROOT = os.path.dirname(__file__) + "/.."
 
 
+class ModelConfigError(ValueError):
+    """
+    Raised when a model file is missing data the model needs to produce results.
+    """
+
+
 def get_src_or_loc(arg):
     """
     Attempts to create an EnergySource or EnergyLocation instance from the given argument.
@@ -1,11 +1,10 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import yaml
 from .carbon import Carbon, SourceType
 from .common import ACT_ROOT
-from .logger import log
-from .units import kg, units
+from .units import units
+from .weight_based_model import _WeightBasedModel
 from enum import Enum
 
 DEFAULT_CONNECTOR_MODEL_FILE = f"{ACT_ROOT}/models/passives/connector.yaml"
@@ -18,7 +17,7 @@ class ConnectorType(Enum):
     PERIPHERAL = "peripheral"  # Peripheral type bus
 
 
-class ConnectorModel:
+class ConnectorModel(_WeightBasedModel):
     """
     Connector carbon emissions model based on weight and material type.
     
@@ -30,33 +29,16 @@ class ConnectorModel:
     Formula: carbon = weight * emission_factor * number_of_connectors
     """
 
-    def __init__(self, model_file: str = DEFAULT_CONNECTOR_MODEL_FILE):
-        """
-        Initializes the ConnectorModel instance with a model file.
-        
-        Args:
-            model_file (str): The path to the model file. Defaults to DEFAULT_CONNECTOR_MODEL_FILE.
-        """
-        with open(model_file) as handle:
-            model_data = yaml.load(handle, Loader=yaml.FullLoader)
-        
-        # Load emission factors for connector types
-        self.emission_factors = {}
-        for connector_type, factor in model_data.items():
-            try:
-                self.emission_factors[ConnectorType(connector_type)] = units(factor)
-            except ValueError:
-                log.warn(f"Unknown connector type '{connector_type}' in model file, skipping.")
-        
-        # Ensure we have at least a generic factor
-        if ConnectorType.GENERIC not in self.emission_factors:
-            log.error("Generic connector emission factor missing from model.")
-            exit(-1)
-    
+    type_enum = ConnectorType
+    source_type = SourceType.CONNECTOR
+    default_model_file = DEFAULT_CONNECTOR_MODEL_FILE
+    generic_fallback = None
+    label = "connector"
+
     def get_carbon(
         self,
         weight: units,
-        connector_type: ConnectorType = ConnectorType.GENERIC,
+        connector_type: ConnectorType | str = ConnectorType.GENERIC,
         n_connectors: int = 1
     ) -> Carbon:
         """
@@ -64,7 +46,7 @@ class ConnectorModel:
         
         Args:
             weight: The weight of a single connector
-            connector_type: The type of connector. Defaults to ConnectorType.PERIPHERAL
+            connector_type: The type of connector, as a ConnectorType or its string value. Defaults to ConnectorType.PERIPHERAL
             n_connectors: The number of connectors. Defaults to 1
         
         Returns:
@@ -73,23 +55,4 @@ class ConnectorModel:
         Raises:
             AssertionError: If the weight is not in units of mass
         """
-        assert weight.check(kg), f"Expected weight units for connector model but got {weight}"
-        
-        # Get the emission factor for this connector type
-        if connector_type not in self.emission_factors:
-            log.warn(
-                f"Connector type {connector_type} not found in model. Using generic emission factor."
-            )
-            emission_factor = self.emission_factors[ConnectorType.GENERIC]
-        else:
-            emission_factor = self.emission_factors[connector_type]
-        
-        # Calculate carbon: weight × emission_factor × number of connectors
-        carbon_per_connector = weight * emission_factor
-        total_carbon = carbon_per_connector * n_connectors
-        
-        log.debug(
-            f"Connector carbon calculation: {weight} * {emission_factor} * {n_connectors} = {total_carbon}"
-        )
-        
-        return Carbon(total_carbon, SourceType.CONNECTOR)
\ No newline at end of file
+        return super().get_carbon(weight, connector_type, n_connectors)
@@ -3,11 +3,10 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import yaml
-
 from .common import ACT_ROOT, DRAMProcess
 from .storage_model import StorageModel
 from .units import units
+from .utils import load_yaml
 
 DEFAULT_DRAM_CONFIG = f"{ACT_ROOT}/models/dram/dram_hynix.yaml"
 
@@ -24,7 +23,5 @@ class DRAMModel(StorageModel):
         Initializes a new instance of the DRAMModel class.
         """
         # Load the DRAM model
-        with open(model_file) as f:
-            dram_model: dict = yaml.load(f, Loader=yaml.FullLoader)
-            dram_model = {DRAMProcess(k): units(v) for k, v in dram_model.items()}
+        dram_model = {DRAMProcess(k): units(v) for k, v in load_yaml(model_file).items()}
         super().__init__(fab_model=dram_model)
@@ -4,11 +4,11 @@
 # LICENSE file in the root directory of this source tree.
 
 
-import yaml
 from .units import *
 
 from .common import ACT_ROOT, HDDProcess
 from .storage_model import StorageModel
+from .utils import load_yaml
 
 DEFAULT_HDD_CONFIG = [
     f"{ACT_ROOT}/models/hdd/hdd_consumer.yaml",
@@ -37,9 +37,7 @@ class HDDModel(StorageModel):
         # Load the HDD carbon cost models
         hdd_model = dict()
         for mfile in model_files:
-            with open(mfile) as f:
-                model_data = yaml.load(f, Loader=yaml.FullLoader)
-                hdd_model.update(model_data)
+            hdd_model.update(load_yaml(mfile))
 
         hdd_model = {HDDProcess(k): units(v) for k, v in hdd_model.items()}
         super().__init__(fab_model=hdd_model)
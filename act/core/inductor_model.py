@@ -2,11 +2,14 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import yaml
+import numpy as np
+
+from ._model_loader import FactorTable, LazyLoadMixin, _value_map, enum_indices
 from .carbon import Carbon, SourceType
 from .common import ACT_ROOT
 from .logger import log
-from .units import kg, units
+from .units import _KG_DIM, _q, units
+from .utils import load_yaml, warn_once
 from enum import Enum
 
 DEFAULT_INDUCTOR_MODEL_FILE = f"{ACT_ROOT}/models/passives/inductor.yaml"
@@ -26,7 +29,17 @@ class InductorType(Enum):
     GENERIC = "generic"
 
 
-class InductorModel:
+"""Inductor types that use the package-based calculation."""
+_PACKAGE_TYPES = frozenset({
+    InductorType.PKG_0201,
+    InductorType.PKG_0402,
+    InductorType.PKG_0603,
+    InductorType.PKG_0805,
+    InductorType.GENERIC,
+})
+
+
+class InductorModel(LazyLoadMixin):
     """
     Inductor carbon emissions model.
     
@@ -40,35 +53,87 @@ class InductorModel:
         Initializes the InductorModel instance with a model file.
         
         Args:
-            model_file (str): The path to the model file. Defaults to DEFAULT_INDUCTOR_MODEL_FILE.
+            model_file (str): The path to the model file, loaded on first use. Defaults to DEFAULT_INDUCTOR_MODEL_FILE.
+        """
+        self._model_file = model_file
+
+    @property
+    def weight_based_factor(self):
+        """
+        The weight-based emission factor, or None if the model file has none.
+        Loads the model file on first access.
         """
-        with open(model_file) as handle:
-            model_data = yaml.load(handle, Loader=yaml.FullLoader)
+        self._ensure_loaded()
+        return self._weight_based_factor
+
+    @weight_based_factor.setter
+    def weight_based_factor(self, weight_based_factor):
+        self._ensure_loaded()
+        self._weight_based_factor = weight_based_factor
+
+    @property
+    def package_emission_factors(self):
+        """Mapping of InductorType to package emission factor. Loads the model file on first access."""
+        self._ensure_loaded()
+        return self._package_emission_factors
+
+    @package_emission_factors.setter
+    def package_emission_factors(self, package_emission_factors):
+        self._ensure_loaded()
+        self._package_emission_factors = FactorTable(package_emission_factors)
+        self._build_package_array()
+
+    def _load(self):
+        """Loads the model file and builds the factor tables."""
+        model_data = load_yaml(self._model_file)
         
         # Separate weight-based and package-based models
-        self.weight_based_factor = None
-        self.package_emission_factors = {}
+        self._weight_based_factor = None
+        self._package_emission_factors = FactorTable()
         
         for key, value in model_data.items():
             if key == "weight_based":
-                self.weight_based_factor = units(value)
+                self._weight_based_factor = _q(value)
             else:
                 try:
                     inductor_type = InductorType(key)
-                    self.package_emission_factors[inductor_type] = units(value)
+                    self._package_emission_factors[inductor_type] = _q(value)
                 except ValueError:
                     log.warn(f"Unknown inductor type '{key}' in model file, skipping.")
         
         # Set generic default to 0805 if available
-        if InductorType.PKG_0805 in self.package_emission_factors:
-            self.package_emission_factors[InductorType.GENERIC] = (
-                self.package_emission_factors[InductorType.PKG_0805]
+        if InductorType.PKG_0805 in self._package_emission_factors:
+            self._package_emission_factors[InductorType.GENERIC] = (
+                self._package_emission_factors[InductorType.PKG_0805]
             )
 
+        # Complete the package table so every package type resolves with a single lookup in
+        # get_carbon, defaulting to 0805 (or the first listed package if 0805 is missing)
+        default_factor = self._package_emission_factors.get(
+            InductorType.PKG_0805,
+            next(iter(self._package_emission_factors.values()), None),
+        )
+        if default_factor is not None:
+            for t in InductorType:
+                if t in _PACKAGE_TYPES and t not in self._package_emission_factors:
+                    warn_once(f"Inductor package type {t} not found in {self._model_file}. Using 0805 as default.")
+                    self._package_emission_factors[t] = default_factor
+
+        self._build_package_array()
+
+    def _build_package_array(self):
+        """Builds the package factor array for get_carbon_batch from package_emission_factors."""
+        # Package factor magnitudes (kg CO2e per inductor) indexed by position in InductorType
+        self._package_array = np.zeros(len(InductorType), dtype=np.float64)
+        for i, t in enumerate(InductorType):
+            if t in _PACKAGE_TYPES and t in self._package_emission_factors:
+                self._package_array[i] = self._package_emission_factors[t].m_as("kg")
+        self._package_array_version = self._package_emission_factors.version
+
     def get_carbon(
         self,
         n_inductors: int = 1,
-        inductor_type: InductorType = InductorType.GENERIC,
+        inductor_type: InductorType | str = InductorType.GENERIC,
         weight=None
     ) -> Carbon:
         """
@@ -80,38 +145,27 @@ class InductorModel:
         
         Args:
             n_inductors: Number of inductors
-            inductor_type: Inductor type (weight_based, 0201, 0402, 0603, 0805)
+            inductor_type: Inductor type (weight_based, 0201, 0402, 0603, 0805), as an InductorType or its string value
             weight: Optional weight for weight-based calculation
         
         Returns:
             Carbon: The total carbon emissions for the inductors
         """
+        self._ensure_loaded()
+        inductor_type = _value_map(InductorType).get(inductor_type, inductor_type)
+
         # Determine calculation method
-        is_package_type = inductor_type in [
-            InductorType.PKG_0201,
-            InductorType.PKG_0402,
-            InductorType.PKG_0603,
-            InductorType.PKG_0805,
-            InductorType.GENERIC
-        ]
+        is_package_type = inductor_type in _PACKAGE_TYPES
         
         # Method 1: Package-based calculation
         if is_package_type and weight is None:
-            if inductor_type not in self.package_emission_factors:
-                log.warn(
-                    f"Inductor package type {inductor_type} not found. Using 0805 as default."
-                )
-                emission_factor = self.package_emission_factors.get(
-                    InductorType.PKG_0805,
-                    list(self.package_emission_factors.values())[0]
-                )
-            else:
-                emission_factor = self.package_emission_factors[inductor_type]
+            emission_factor = self._package_emission_factors[inductor_type]
             
             total_carbon = emission_factor * n_inductors
             
             log.debug(
-                f"Inductor carbon (package-based): {emission_factor} × {n_inductors} = {total_carbon}"
+                "Inductor carbon (package-based): %s × %s = %s",
+                emission_factor, n_inductors, total_carbon,
             )
             
             return Carbon(total_carbon, SourceType.INDUCTOR)
@@ -122,16 +176,53 @@ class InductorModel:
                 log.warn("Weight not provided for inductor weight-based calculation. Skipping.")
                 return Carbon(units("0 kg"), SourceType.INDUCTOR)
             
-            assert weight.check(kg), f"Expected weight units for inductor model but got {weight}"
+            assert weight.dimensionality == _KG_DIM, f"Expected weight units for inductor model but got {weight}"
             
-            if self.weight_based_factor is None:
+            if self._weight_based_factor is None:
                 log.error("Weight-based emission factor not found in inductor model.")
                 return Carbon(units("0 kg"), SourceType.INDUCTOR)
             
-            total_carbon = weight * self.weight_based_factor * n_inductors
+            total_carbon = weight * self._weight_based_factor * n_inductors
             
             log.debug(
-                f"Inductor carbon (weight-based): {weight} * {self.weight_based_factor} * {n_inductors} = {total_carbon}"
+                "Inductor carbon (weight-based): %s * %s * %s = %s",
+                weight, self._weight_based_factor, n_inductors, total_carbon,
             )
             
-            return Carbon(total_carbon, SourceType.INDUCTOR)
\ No newline at end of file
+            return Carbon(total_carbon, SourceType.INDUCTOR)
+
+    def get_carbon_batch(
+        self,
+        types: list,
+        weights_kg: np.ndarray,
+        counts: np.ndarray,
+    ) -> Carbon:
+        """
+        Calculates the total carbon emissions for many inductor rows at once.
+
+        Mirrors get_carbon: if weights are provided every row uses the weight-based
+        calculation, otherwise every row uses its package emission factor.
+
+        Args:
+            types: The type of each row, as InductorType members or their string values
+            weights_kg: Weight of a single inductor in each row, in kg, or None to use package factors
+            counts: Number of inductors in each row
+
+        Returns:
+            Carbon: The summed carbon emissions over all rows
+        """
+        self._ensure_loaded()
+        if weights_kg is None:
+            if self._package_emission_factors.version != self._package_array_version:
+                self._build_package_array()
+            totals = self._package_array[enum_indices(InductorType, types)] * np.asarray(counts)
+        elif self._weight_based_factor is None:
+            log.error("Weight-based emission factor not found in inductor model.")
+            return Carbon(units("0 kg"), SourceType.INDUCTOR)
+        else:
+            totals = (
+                np.asarray(weights_kg, dtype=np.float64)
+                * self._weight_based_factor.m_as("kg/kg")
+                * np.asarray(counts)
+            )
+        return Carbon(units.Quantity(float(totals.sum()), "kg"), SourceType.INDUCTOR)
@@ -4,7 +4,6 @@
 # LICENSE file in the root directory of this source tree.
 
 import pint
-import yaml
 
 from .carbon import Carbon, SourceType
 
@@ -18,7 +17,7 @@ from .common import (
 )
 from .logger import log
 from .units import mm2, units
-from .utils import load_ci_model
+from .utils import load_ci_model, load_yaml
 
 DEFAULT_EPA_CONFIG = f"{ACT_ROOT}/models/logic/epa.yaml"
 DEFAULT_MATERIALS_CONFIG = f"{ACT_ROOT}/models/logic/materials.yaml"
@@ -35,7 +34,7 @@ class LogicModel:
         epa_model (dict): A dictionary mapping logic processes to energy per unit area.
         materials_model (dict): A dictionary mapping logic processes to raw materials per unit area.
         gpa_model (dict): A dictionary mapping abatement levels to dictionaries of logic processes to gas emissions per unit area.
-        ci_model (dict): A dictionary mapping energy locations to carbon intensity models.
+        ci_model (dict): A mapping of energy locations to carbon intensity models, shared between instances and not to be mutated.
     """
 
     def __init__(
@@ -57,30 +56,26 @@ class LogicModel:
             world_cpa_file (str, optional): The path to the world CPA lookup table. Defaults to DEFAULT_WORLD_CPA_CONFIG.
         """
         # energy per unit area
-        with open(epa_file) as f:
-            self.epa_model = {
-                LogicProcess(k): units(v)
-                for k, v in yaml.load(f, Loader=yaml.FullLoader).items()
-            }
+        self.epa_model = {
+            LogicProcess(k): units(v)
+            for k, v in load_yaml(epa_file).items()
+        }
 
         # raw materials per unit area
-        with open(materials_config) as f:
-            self.materials_model = {
-                LogicProcess(k): units(v)
-                for k, v in yaml.load(f, Loader=yaml.FullLoader).items()
-            }
+        self.materials_model = {
+            LogicProcess(k): units(v)
+            for k, v in load_yaml(materials_config).items()
+        }
 
         self.gpa_model = dict()
-        with open(gpa95_file) as f:
-            self.gpa_model[AbatementLevel.GPA95] = {
-                LogicProcess(k): units(v)
-                for k, v in yaml.load(f, Loader=yaml.FullLoader).items()
-            }
-        with open(gpa99_file) as f:
-            self.gpa_model[AbatementLevel.GPA99] = {
-                LogicProcess(k): units(v)
-                for k, v in yaml.load(f, Loader=yaml.FullLoader).items()
-            }
+        self.gpa_model[AbatementLevel.GPA95] = {
+            LogicProcess(k): units(v)
+            for k, v in load_yaml(gpa95_file).items()
+        }
+        self.gpa_model[AbatementLevel.GPA99] = {
+            LogicProcess(k): units(v)
+            for k, v in load_yaml(gpa99_file).items()
+        }
         self.gpa_model[AbatementLevel.GPA97] = {
             key: (
                 self.gpa_model[AbatementLevel.GPA95][key]
@@ -94,11 +89,10 @@ class LogicModel:
         self.ci_model = load_ci_model()
 
         # pre-computed Total Carbon (g CO2eq / mm2) using World average CI
-        with open(world_cpa_file) as f:
-            self.world_cpa_model = {
-                LogicProcess(k): units(v)
-                for k, v in yaml.load(f, Loader=yaml.FullLoader).items()
-            }
+        self.world_cpa_model = {
+            LogicProcess(k): units(v)
+            for k, v in load_yaml(world_cpa_file).items()
+        }
 
     def get_cpa(
         self,
@@ -6,11 +6,10 @@
 import os
 from enum import Enum
 
-import yaml
-
 from .carbon import Carbon, SourceType
 from .common import ACT_ROOT
 from .units import g, units
+from .utils import load_yaml
 
 DEFAULT_MATERIALS_CONFIG = f"{ACT_ROOT}/models/materials/materials.yaml"
 
@@ -33,8 +32,7 @@ class MaterialsModel:
         Args:
             model_file (str, optional): The path to the materials data file. Defaults to DEFAULT_MATERIALS_CONFIG.
         """
-        with open(model_file) as handle:
-            model_data = yaml.load(handle, Loader=yaml.FullLoader)
+        model_data = load_yaml(model_file)
         materials_data = model_data["materials"]
 
         # Dynamically generate the materials enum
@@ -3,18 +3,33 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import yaml
-
 from .carbon import Carbon, SourceType
-from .common import ACT_ROOT
+from .common import ACT_ROOT, ModelConfigError
 from .logger import log
 
-from .units import mm2, units
+from .units import _q, mm2
+from .utils import load_yaml
 
 DEFAULT_PCB_MODEL_FILE = f"{ACT_ROOT}/models/materials/pcb.yaml"
 
+"""Dimensionality of area, resolved once for the get_carbon unit check."""
+_AREA_DIM = mm2.dimensionality
+
 INTERPOLATED_AVERAGE_KEY = "cpla"
 
+"""Layer counts up to which the interpolated carbon per area is precomputed."""
+MAX_PRECOMPUTED_LAYERS = 32
+
+"""Named (non layer count) entries of the PCB model file, mapped to the attribute and parser for each."""
+_NAMED_ENTRIES = {
+    INTERPOLATED_AVERAGE_KEY: ("interpolated_cpla", _q),
+    "typical_thickness": (
+        "typical_thickness",
+        lambda v: {layer: _q(thick) for layer, thick in v.items()},
+    ),
+    "carbon_coefficient": ("carbon_coefficient", _q),
+}
+
 
 class PCBModel:
     """
@@ -31,29 +46,33 @@ class PCBModel:
         Args:
             model_file (str): The path to the model file. Defaults to DEFAULT_PCB_MODEL_FILE.
         """
-        with open(model_file) as handle:
-            model_data = yaml.load(handle, Loader=yaml.FullLoader)
+        model_data = load_yaml(model_file)
 
         self.model = {}
         self.typical_thickness = {}
         self.carbon_coefficient = None
-        
+        self.interpolated_cpla = None
+
+        # Single pass: named entries go through their parser, everything else is a layer count
         for k, v in model_data.items():
-            if k == INTERPOLATED_AVERAGE_KEY:
-                self.interpolated_cpla = units(v)
-            elif k == "typical_thickness":
-                self.typical_thickness = {layer: units(thick) 
-                                         for layer, thick in v.items()}
-            elif k == "carbon_coefficient":
-                self.carbon_coefficient = units(v)
+            entry = _NAMED_ENTRIES.get(k)
+            if entry is None:
+                self.model[k] = _q(v)
             else:
-                self.model[k] = units(v)
-        
-        if INTERPOLATED_AVERAGE_KEY not in self.model and INTERPOLATED_AVERAGE_KEY not in model_data:
+                attr, parse = entry
+                setattr(self, attr, parse(v))
+
+        if self.interpolated_cpla is None:
             log.warn(
                 "PCB model does not have a default interpolated average carbon / area / layer. If an unregistered number of layers is provided, the model will throw an error."
             )
-            self.interpolated_cpla = None
+
+        # Interpolated carbon per area for common layer counts, so get_carbon skips the multiply
+        self._cpla_by_layers = (
+            {n: self.interpolated_cpla * n for n in range(1, MAX_PRECOMPUTED_LAYERS + 1)}
+            if self.interpolated_cpla is not None
+            else {}
+        )
 
     def get_carbon(self, area, layers: int, thickness=None):
         """
@@ -69,28 +88,30 @@ class PCBModel:
 
         Raises:
             AssertionError: If the area is not in units of area.
+            ModelConfigError: If the number of layers has no model entry and no interpolated default is available.
         """
-        assert area.check(mm2), f"Expected area units for PCB model but got {area}"
+        assert area.dimensionality == _AREA_DIM, f"Expected area units for PCB model but got {area}"
         
         # If thickness is provided, use the thickness-based formula
         if thickness is not None and self.carbon_coefficient is not None:
             c = area * layers * thickness * self.carbon_coefficient
             log.debug(
-                f"Using thickness-based PCB calculation: {area} * {layers} layers * {thickness} * {self.carbon_coefficient}"
+                "Using thickness-based PCB calculation: %s * %s layers * %s * %s",
+                area, layers, thickness, self.carbon_coefficient,
             )
             return Carbon(c, SourceType.PCB)
         
         # Otherwise, use the layer-based area calculation (original method)
-        if layers in self.model:
-            cpa = self.model[layers]
-        elif self.interpolated_cpla is not None:  # otherwise interpolate
+        cpa = self.model.get(layers)
+        if cpa is None:  # otherwise interpolate
+            cpa = self._cpla_by_layers.get(layers)
+        if cpa is None and self.interpolated_cpla is not None:
             cpa = self.interpolated_cpla * layers
-        else:  # otherwise exit
-            log.critical(
+        if cpa is None:  # otherwise raise
+            raise ModelConfigError(
                 f"No PCB model for number of layers {layers} and not default carbon per area per layer provided. Cannot continue."
             )
-            exit(-1)
 
         c = cpa * area
-        log.debug(f"Using layer-based PCB calculation: {layers} layers * {area}")
+        log.debug("Using layer-based PCB calculation: %s layers * %s", layers, area)
         return Carbon(c, SourceType.PCB)
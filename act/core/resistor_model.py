@@ -1,7 +1,9 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import yaml
+import numpy as np
+
+from ._model_loader import FactorTable, enum_indices, load_emission_factors, shared_model
 from .carbon import Carbon, SourceType
 from .common import ACT_ROOT
 from .logger import log
@@ -11,8 +13,8 @@ from enum import Enum
 DEFAULT_RESISTOR_MODEL_FILE = f"{ACT_ROOT}/models/passives/resistor.yaml"
 
 
-class ResistorType(Enum):
-    """Resistor package types"""
+class ResistorType(str, Enum):
+    """Resistor package types. Members are strings, so they hash and compare equal to their values."""
     PKG_0201 = "0201"
     PKG_0402 = "0402"
     PKG_0603 = "0603"
@@ -27,64 +29,126 @@ class ResistorModel:
     Formula: carbon = emission_factor_per_package × quantity
     """
 
+    __slots__ = ("_emission_factors", "_ef_by_name", "_default_ef", "_factor_vec", "_tables_version")
+
     def __init__(self, model_file: str = DEFAULT_RESISTOR_MODEL_FILE):
         """
         Initializes the ResistorModel instance with a model file.
         
         Args:
             model_file (str): The path to the model file. Defaults to DEFAULT_RESISTOR_MODEL_FILE.
+
+        Raises:
+            ModelConfigError: If the model file has no resistor emission factors
         """
-        with open(model_file) as handle:
-            model_data = yaml.load(handle, Loader=yaml.FullLoader)
-        
         # Load emission factors by package type
-        self.emission_factors = {}
-        for package_type, factor in model_data.items():
-            try:
-                self.emission_factors[ResistorType(package_type)] = units(factor)
-            except ValueError:
-                log.warn(f"Unknown resistor package type '{package_type}' in model file, skipping.")
-        
-        # Ensure we have at least one package type
-        if not self.emission_factors:
-            log.error("No resistor emission factors found in model file.")
-            exit(-1)
-        
+        emission_factors = load_emission_factors(model_file, ResistorType)
+
         # Set generic default
-        if ResistorType.PKG_0805 in self.emission_factors and ResistorType.GENERIC not in self.emission_factors:
-            self.emission_factors[ResistorType.GENERIC] = self.emission_factors[ResistorType.PKG_0805]
+        if ResistorType.PKG_0805 in emission_factors and ResistorType.GENERIC not in emission_factors:
+            emission_factors[ResistorType.GENERIC] = emission_factors[ResistorType.PKG_0805]
+        self.emission_factors = emission_factors
+
+    @property
+    def emission_factors(self):
+        """Mapping of ResistorType to emission factor per package."""
+        return self._emission_factors
+
+    @emission_factors.setter
+    def emission_factors(self, emission_factors):
+        self._emission_factors = FactorTable(emission_factors)
+        self._build_tables()
+
+    def _build_tables(self):
+        """Builds the float factor tables from emission_factors."""
+        emission_factors = self._emission_factors
+
+        # Emission factors as plain kg CO2e magnitudes keyed by each type's string value, so
+        # get_carbon needs a single lookup and float multiply. ResistorType members are str, so the
+        # same lookup serves an enum member or a package string from BOM parsing
+        self._ef_by_name = {t.value: f.m_as("kg") for t, f in emission_factors.items()}
+        default_factor = emission_factors.get(ResistorType.PKG_0805)
+        if default_factor is None:
+            default_factor = next(iter(emission_factors.values()))
+        self._default_ef = default_factor.m_as("kg")
+
+        # Factor magnitudes indexed by position in ResistorType, for get_carbon_batch. Types
+        # missing from the model file use the default factor, as in get_carbon.
+        self._factor_vec = np.array(
+            [self._ef_by_name.get(t.value, self._default_ef) for t in ResistorType],
+            dtype=np.float64,
+        )
+        self._tables_version = emission_factors.version
 
     def get_carbon(
         self,
         n_resistors: int = 1,
-        resistor_type: ResistorType = ResistorType.PKG_0805
+        resistor_type: ResistorType | str = ResistorType.PKG_0805
     ) -> Carbon:
         """
         Calculates the carbon emissions for resistors based on package type.
         
         Args:
             n_resistors: Number of resistors
-            resistor_type: Resistor package type (0201, 0402, 0603, 0805)
+            resistor_type: Resistor package type (0201, 0402, 0603, 0805), as a ResistorType or its string value
         
         Returns:
             Carbon: The total carbon emissions for the resistors
         """
+        if self._emission_factors.version != self._tables_version:
+            self._build_tables()
+
         # Get emission factor for this package type
-        if resistor_type not in self.emission_factors:
-            log.warn(
-                f"Resistor package type {resistor_type} not found. Using 0805 as default."
-            )
-            emission_factor = self.emission_factors.get(
-                ResistorType.PKG_0805,
-                list(self.emission_factors.values())[0]
-            )
-        else:
-            emission_factor = self.emission_factors[resistor_type]
+        emission_factor = self._ef_by_name.get(resistor_type)
+        if emission_factor is None:
+            log.warn("Resistor package type %s not found. Using 0805 as default.", resistor_type)
+            emission_factor = self._default_ef
         
-        total_carbon = emission_factor * n_resistors
+        total_carbon = units.Quantity(emission_factor * n_resistors, "kg")
         
         log.debug(
-            f"Resistor carbon (package-based): {emission_factor} * {n_resistors} = {total_carbon}"
+            "Resistor carbon (package-based): %s kg CO2e * %s = %s",
+            emission_factor, n_resistors, total_carbon,
         )
         
-        return Carbon(total_carbon, SourceType.RESISTOR)
\ No newline at end of file
+        return Carbon(total_carbon, SourceType.RESISTOR)
+
+    def get_carbon_batch(
+        self,
+        types: list,
+        weights_kg: np.ndarray,
+        counts: np.ndarray,
+    ) -> Carbon:
+        """
+        Calculates the total carbon emissions for many resistor rows at once.
+
+        Args:
+            types: Resistor package type of each row, as ResistorType members or their string values
+            weights_kg: Unused, as resistor emissions are package-based. May be None
+            counts: Number of resistors in each row
+
+        Returns:
+            Carbon: The summed carbon emissions over all rows
+
+        Raises:
+            KeyError: If a row's type is not a ResistorType
+        """
+        if self._emission_factors.version != self._tables_version:
+            self._build_tables()
+        idx = enum_indices(ResistorType, types)
+        total = float((self._factor_vec[idx] * np.asarray(counts)).sum())
+        return Carbon(units.Quantity(total, "kg"), SourceType.RESISTOR)
+
+
+def get_resistor_model(model_file: str = DEFAULT_RESISTOR_MODEL_FILE) -> ResistorModel:
+    """
+    Returns a shared ResistorModel for a model file, constructing it only the first time the file is
+    seen or after it changes on disk.
+
+    Args:
+        model_file (str): The path to the model file. Defaults to DEFAULT_RESISTOR_MODEL_FILE.
+
+    Returns:
+        ResistorModel: The model instance. It is shared between callers and must not be mutated.
+    """
+    return shared_model(ResistorModel, model_file)
@@ -4,11 +4,10 @@
 # LICENSE file in the root directory of this source tree.
 
 
-import yaml
-
 from .common import ACT_ROOT, SSDProcess
 from .storage_model import StorageModel
 from .units import units
+from .utils import load_yaml
 
 
 class SSDModel(StorageModel):
@@ -21,23 +20,20 @@ class SSDModel(StorageModel):
         Initializes a new instance of the SSDModel class.
         """
         # Load the SSD storage model configuration
-        with open(f"{ACT_ROOT}/models/ssd/ssd_hynix.yaml", "r") as f:
-            ssd_model: dict[SSDProcess, units] = {
+        ssd_model: dict[SSDProcess, units] = {
+            SSDProcess(k): units(v)
+            for k, v in load_yaml(f"{ACT_ROOT}/models/ssd/ssd_hynix.yaml").items()
+        }
+        ssd_model.update(
+            {
+                SSDProcess(k): units(v)
+                for k, v in load_yaml(f"{ACT_ROOT}/models/ssd/ssd_seagate.yaml").items()
+            }
+        )
+        ssd_model.update(
+            {
                 SSDProcess(k): units(v)
-                for k, v in yaml.load(f, Loader=yaml.FullLoader).items()
+                for k, v in load_yaml(f"{ACT_ROOT}/models/ssd/ssd_western.yaml").items()
             }
-        with open(f"{ACT_ROOT}/models/ssd/ssd_seagate.yaml", "r") as f:
-            ssd_model.update(
-                {
-                    SSDProcess(k): units(v)
-                    for k, v in yaml.load(f, Loader=yaml.FullLoader).items()
-                }
-            )
-        with open(f"{ACT_ROOT}/models/ssd/ssd_western.yaml", "r") as f:
-            ssd_model.update(
-                {
-                    SSDProcess(k): units(v)
-                    for k, v in yaml.load(f, Loader=yaml.FullLoader).items()
-                }
-            )
+        )
         super().__init__(fab_model=ssd_model)
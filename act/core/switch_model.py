@@ -1,18 +1,20 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import yaml
+import numpy as np
+
+from ._model_loader import FactorTable, enum_indices, load_emission_factors, shared_model
 from .carbon import Carbon, SourceType
 from .common import ACT_ROOT
 from .logger import log
-from .units import kg, units
+from .units import _KG_DIM, units
 from enum import Enum
 
 DEFAULT_SWITCH_MODEL_FILE = f"{ACT_ROOT}/models/passives/switch.yaml"
 
 
-class SwitchType(Enum):
-    """Enumeration of switch types"""
+class SwitchType(str, Enum):
+    """Enumeration of switch types. Members are strings, so they hash and compare equal to their values."""
     GENERIC = "generic"  # Generic switch (default)
     # Add more specific types as needed
 
@@ -26,33 +28,51 @@ class SwitchModel:
     Formula: carbon = weight (kg) × emission_factor (kg CO2e/kg) × quantity
     """
 
+    __slots__ = ("_emission_factors", "_ef_by_name", "_default_ef", "_factor_vec", "_tables_version")
+
     def __init__(self, model_file: str = DEFAULT_SWITCH_MODEL_FILE):
         """
         Initializes the SwitchModel instance with a model file.
         
         Args:
             model_file (str): The path to the model file. Defaults to DEFAULT_SWITCH_MODEL_FILE.
+
+        Raises:
+            ModelConfigError: If the model file has no generic switch emission factor
         """
-        with open(model_file) as handle:
-            model_data = yaml.load(handle, Loader=yaml.FullLoader)
-        
-        # Load emission factors for switch types
-        self.emission_factors = {}
-        for switch_type, factor in model_data.items():
-            try:
-                self.emission_factors[SwitchType(switch_type)] = units(factor)
-            except ValueError:
-                log.warn(f"Unknown switch type '{switch_type}' in model file, skipping.")
-        
-        # Ensure we have at least a generic factor
-        if SwitchType.GENERIC not in self.emission_factors:
-            log.error("No switch emission factors found in model file.")
-            exit(-1)
+        # Load emission factors for switch types, which must include a generic factor
+        self.emission_factors = load_emission_factors(model_file, SwitchType, required=SwitchType.GENERIC)
+
+    @property
+    def emission_factors(self):
+        """Mapping of SwitchType to emission factor."""
+        return self._emission_factors
+
+    @emission_factors.setter
+    def emission_factors(self, emission_factors):
+        self._emission_factors = FactorTable(emission_factors)
+        self._build_tables()
+
+    def _build_tables(self):
+        """Builds the float factor tables from emission_factors."""
+        # Emission factors as plain kg CO2e / kg magnitudes keyed by each type's string value, so
+        # get_carbon needs a single lookup and float multiply. SwitchType members are str, so the
+        # same lookup serves an enum member or a type string from BOM parsing
+        self._ef_by_name = {t.value: f.m_as("kg/kg") for t, f in self._emission_factors.items()}
+        self._default_ef = self._ef_by_name[SwitchType.GENERIC.value]
+
+        # Factor magnitudes indexed by position in SwitchType, for get_carbon_batch. Types
+        # missing from the model file use the default factor, as in get_carbon.
+        self._factor_vec = np.array(
+            [self._ef_by_name.get(t.value, self._default_ef) for t in SwitchType],
+            dtype=np.float64,
+        )
+        self._tables_version = self._emission_factors.version
     
     def get_carbon(
         self,
         weight: units,
-        switch_type: SwitchType = SwitchType.GENERIC,
+        switch_type: SwitchType | str = SwitchType.GENERIC,
         n_switches: int = 1
     ) -> Carbon:
         """
@@ -60,7 +80,7 @@ class SwitchModel:
         
         Args:
             weight: The weight of a single switch
-            switch_type: The type of switch. Defaults to SwitchType.GENERIC
+            switch_type: The type of switch, as a SwitchType or its string value. Defaults to SwitchType.GENERIC
             n_switches: The number of switches. Defaults to 1
         
         Returns:
@@ -69,22 +89,66 @@ class SwitchModel:
         Raises:
             AssertionError: If the weight is not in units of mass
         """
-        assert weight.check(kg), f"Expected weight units for switch model but got {weight}"
+        assert weight.dimensionality == _KG_DIM, f"Expected weight units for switch model but got {weight}"
+        if self._emission_factors.version != self._tables_version:
+            self._build_tables()
         
         # Get the emission factor for this switch type
-        if switch_type not in self.emission_factors:
-            log.warn(
-                f"Switch type {switch_type} not found in model. Using generic emission factor."
-            )
-            emission_factor = self.emission_factors[SwitchType.GENERIC]
-        else:
-            emission_factor = self.emission_factors[switch_type]
+        emission_factor = self._ef_by_name.get(switch_type)
+        if emission_factor is None:
+            log.warn("Switch type %s not found in model. Using generic emission factor.", switch_type)
+            emission_factor = self._default_ef
         
         # Calculate carbon: weight × emission_factor × number of switches
-        total_carbon = weight * emission_factor * n_switches
+        total_carbon = units.Quantity(
+            weight.m_as("kg") * emission_factor * n_switches, "kg"
+        )
         
         log.debug(
-            f"Switch carbon calculation: {weight} * {emission_factor} * {n_switches} = {total_carbon}"
+            "Switch carbon calculation: %s * %s kg CO2e/kg * %s = %s",
+            weight, emission_factor, n_switches, total_carbon,
         )
         
-        return Carbon(total_carbon, SourceType.SWITCH)
\ No newline at end of file
+        return Carbon(total_carbon, SourceType.SWITCH)
+
+    def get_carbon_batch(
+        self,
+        types: list,
+        weights_kg: np.ndarray,
+        counts: np.ndarray,
+    ) -> Carbon:
+        """
+        Calculates the total carbon emissions for many switch rows at once.
+
+        Args:
+            types: The type of each row, as SwitchType members or their string values
+            weights_kg: The weight of a single switch in each row, in kg
+            counts: The number of switches in each row
+
+        Returns:
+            Carbon: The summed carbon emissions over all rows
+
+        Raises:
+            KeyError: If a row's type is not a SwitchType
+        """
+        if self._emission_factors.version != self._tables_version:
+            self._build_tables()
+        idx = enum_indices(SwitchType, types)
+        total = float(
+            (np.asarray(weights_kg, dtype=np.float64) * self._factor_vec[idx] * np.asarray(counts)).sum()
+        )
+        return Carbon(units.Quantity(total, "kg"), SourceType.SWITCH)
+
+
+def get_switch_model(model_file: str = DEFAULT_SWITCH_MODEL_FILE) -> SwitchModel:
+    """
+    Returns a shared SwitchModel for a model file, constructing it only the first time the file is
+    seen or after it changes on disk.
+
+    Args:
+        model_file (str): The path to the model file. Defaults to DEFAULT_SWITCH_MODEL_FILE.
+
+    Returns:
+        SwitchModel: The model instance. It is shared between callers and must not be mutated.
+    """
+    return shared_model(SwitchModel, model_file)
@@ -15,11 +15,24 @@ Defines pint unit constants
 - Most of these variables are already in the UnitRegistry but some may not be
 """
 
+import functools
+
 import pint
 
 units = pint.UnitRegistry()
 pint.set_application_registry(units)  # required for multiprocessing
 
+
+@functools.lru_cache(maxsize=None)
+def _q(value):
+    """
+    Parse a quantity through the unit registry, memoizing the result.
+    Model files repeat the same quantity strings, so each is only parsed once.
+    The returned quantity is shared between callers and must not be mutated in place.
+    """
+    return units(value)
+
+
 # Time units
 fs = units("femtosecond")
 ps = units("picosecond")
@@ -205,6 +218,7 @@ m2 = units("m ** 2")
 # weight for emissions estimates
 g = units("g")
 kg = units("kg")
+_KG_DIM = kg.dimensionality  # resolved once for the weight unit checks in the passive models
 ton = units("metric_ton")
 Mton = 1000000 * ton
 
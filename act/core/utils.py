@@ -3,10 +3,13 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import yaml
 from .units import *
 
+import functools
+import hashlib
+import json
 import math
+import os
 from enum import auto, Enum
 
 from .common import ACT_ROOT, EnergyLocation, EnergySource
@@ -16,44 +19,194 @@ from .logger import log
 DEFAULT_LOCATION_CONFIG = f"{ACT_ROOT}/models/carbon_intensity/location.yaml"
 DEFAULT_SOURCE_CONFIG = f"{ACT_ROOT}/models/carbon_intensity/source.yaml"
 
+"""Environment variable that disables the JSON cache of parsed model files when set to a non-empty value."""
+NO_MODEL_CACHE_ENV = "ACT_NO_MODEL_CACHE"
 
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader():
+    """
+    The YAML loader class for model files. PyYAML is imported here on first use rather than at
+    module import, so importing a model module does not pay for it until a file is parsed.
+
+    Returns:
+        type: The LibYAML-backed safe loader, or the pure-Python one if LibYAML is unavailable.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _model_cache_path(yaml_path):
+    """
+    Location of the JSON cache for a YAML model file. Caches live only in the user cache
+    directory, so neither the package directory nor the directory of a user's model file is
+    written to.
+
+    Args:
+        yaml_path (str): The YAML file path.
+
+    Returns:
+        str: The cache file path.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    digest = hashlib.sha1(os.path.abspath(yaml_path).encode()).hexdigest()[:16]
+    name = f"{os.path.basename(yaml_path)}.cache.json"
+    return os.path.join(cache_home, "act", f"{digest}-{name}")
+
+
+def _parse_yaml(yaml_path):
+    """
+    Parse a YAML file without the JSON cache.
+
+    Args:
+        yaml_path (str): The YAML file path.
+
+    Returns:
+        The parsed YAML document.
+    """
+    import yaml
+
+    with open(yaml_path) as handle:
+        return yaml.load(handle, Loader=_yaml_loader())
+
+
+def _load_model_cached(yaml_path):
+    """
+    Load a YAML model file through a precompiled JSON cache. The cache records the modification
+    time in nanoseconds and the size of the YAML file it was built from, and is only used if both
+    match the file exactly; otherwise the YAML file is parsed and the cache is regenerated.
+    Documents that do not survive a JSON round trip (e.g. with integer keys) are never cached,
+    and an unwritable cache directory only disables the cache. Setting the NO_MODEL_CACHE_ENV
+    environment variable skips the cache entirely, so nothing is read from or written to it.
+
+    Args:
+        yaml_path (str): The YAML file path.
+
+    Returns:
+        The parsed YAML document.
+    """
+    if os.environ.get(NO_MODEL_CACHE_ENV):
+        return _parse_yaml(yaml_path)
+
+    stat = os.stat(yaml_path)
+    source = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    cache_path = _model_cache_path(yaml_path)
+    try:
+        with open(cache_path) as handle:
+            cached = json.load(handle)
+        if cached["source"] == source:
+            return cached["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    data = _parse_yaml(yaml_path)
+
+    try:
+        encoded = json.dumps({"source": source, "data": data})
+    except (TypeError, ValueError):
+        return data
+    if json.loads(encoded)["data"] != data:
+        return data
+
+    # write to a temporary file first so concurrent readers never see a partial cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w") as handle:
+            handle.write(encoded)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return data
+
+
+@functools.lru_cache(maxsize=64)
+def _load_yaml(path, mtime_ns, size):
+    """
+    Parse a YAML file. Results are memoized on the path, modification time and size.
+
+    Args:
+        path (str): The absolute YAML file path.
+        mtime_ns (int): The modification time of the file in nanoseconds, used to invalidate the cache.
+        size (int): The size of the file in bytes, used to invalidate the cache.
+
+    Returns:
+        The parsed YAML document. The result is shared between callers and must not be mutated.
+    """
+    return _load_model_cached(path)
+
+
+def load_yaml(path):
+    """
+    Load a YAML model file, reusing the parsed result if the file is unchanged since the last load.
+
+    Args:
+        path (str): The YAML file path.
+
+    Returns:
+        The parsed YAML document. The result is shared between callers and must not be mutated.
+    """
+    stat = os.stat(path)
+    return _load_yaml(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+"""Number of distinct messages warn_once remembers; older messages may be warned about again."""
+WARN_ONCE_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=WARN_ONCE_CACHE_SIZE)
+def warn_once(message, stacklevel=1):
+    """
+    Log a warning the first time a given message is seen and ignore repeats. Only the
+    WARN_ONCE_CACHE_SIZE most recent messages are remembered.
+
+    Args:
+        message (str): The warning message.
+        stacklevel (int, optional): The stack frame the warning is attributed to, counted from the caller as in logging. Defaults to 1.
+    """
+    log.warn(message, stacklevel=stacklevel + 1)
+
+
+@functools.lru_cache(maxsize=8)
 def load_ci_model(
     loc_ci_config=DEFAULT_LOCATION_CONFIG, src_ci_config=DEFAULT_SOURCE_CONFIG
 ):
     """
     Load the carbon intensity model for the fab. Shared by the logic and OPERATION models.
+    The model is built once per set of configuration files and shared by every caller, so
+    callers must not mutate it.
 
     Args:
         loc_ci_config (str): The location configuration file path. Defaults to DEFAULT_LOCATION_CONFIG.
         src_ci_config (str): The source configuration file path. Defaults to DEFAULT_SOURCE_CONFIG.
 
     Returns:
-        dict: A dictionary mapping EnergyLocation or EnergySource to carbon intensity.
+        dict: A mapping of EnergyLocation or EnergySource to carbon intensity.
     """
     ci_model = {}
-    with open(loc_ci_config) as f:
-        loc_model = yaml.load(f, Loader=yaml.FullLoader)
-        # check if the location model is a dictionary
-        if not isinstance(loc_model, dict):
-            raise ValueError(
-                f"Location CI config must be a YAML mapping (dict), "
-                f"got {type(loc_model).__name__} from {loc_ci_config}"
-            )
-        # convert the location model to a dictionary of EnergyLocation objects and units
-        loc_model = {EnergyLocation(k): units(v) for k, v in loc_model.items()}
-        ci_model.update(loc_model)
-
-    with open(src_ci_config) as f:
-        src_model = yaml.load(f, Loader=yaml.FullLoader)
-        # check if the source model is a dictionary
-        if not isinstance(src_model, dict):
-            raise ValueError(
-                f"Source CI config must be a YAML mapping (dict), "
-                f"got {type(src_model).__name__} from {src_ci_config}"
-            )
-        # convert the source model to a dictionary of EnergySource objects and units
-        src_model = {EnergySource(k): units(v) for k, v in src_model.items()}
-        ci_model.update(src_model)
+    loc_model = load_yaml(loc_ci_config)
+    # check if the location model is a dictionary
+    if not isinstance(loc_model, dict):
+        raise ValueError(
+            f"Location CI config must be a YAML mapping (dict), "
+            f"got {type(loc_model).__name__} from {loc_ci_config}"
+        )
+    # convert the location model to a dictionary of EnergyLocation objects and units
+    ci_model.update({EnergyLocation(k): units(v) for k, v in loc_model.items()})
+
+    src_model = load_yaml(src_ci_config)
+    # check if the source model is a dictionary
+    if not isinstance(src_model, dict):
+        raise ValueError(
+            f"Source CI config must be a YAML mapping (dict), "
+            f"got {type(src_model).__name__} from {src_ci_config}"
+        )
+    # convert the source model to a dictionary of EnergySource objects and units
+    ci_model.update({EnergySource(k): units(v) for k, v in src_model.items()})
 
     return ci_model
 
@@ -0,0 +1,191 @@
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import numpy as np
+
+from ._model_loader import FactorTable, LazyLoadMixin, enum_indices, load_emission_factors
+from .carbon import Carbon, SourceType
+from .common import ModelConfigError
+from .logger import log
+from .units import _KG_DIM, units
+from .utils import warn_once
+from enum import Enum
+
+
+class _WeightBasedModel(LazyLoadMixin):
+    """
+    Shared implementation of the weight-based component models, where each component type
+    maps to a single emission factor read from a model file.
+
+    Subclasses configure the model through the class attributes below and wrap get_carbon
+    with their own argument names. get_carbon attributes its log records to that wrapper, so
+    they keep the subclass's module name.
+
+    Formula: carbon = weight (kg) * emission_factor (kg CO2e/kg) * quantity
+    """
+
+    # Enum of component types. Must define a GENERIC member.
+    type_enum: type[Enum] = None
+
+    # Source type attached to the returned Carbon.
+    source_type: SourceType = None
+
+    # Model file used when none is given to the constructor.
+    default_model_file: str = None
+
+    # Type whose factor stands in for GENERIC when the model file has no generic entry, if any.
+    generic_fallback: Enum = None
+
+    # Component name used in log and error messages.
+    label: str = "component"
+
+    def __init__(self, model_file: str = None):
+        """
+        Initializes the model instance with a model file.
+
+        Args:
+            model_file (str): The path to the model file, loaded on first use. Defaults to the class's default_model_file.
+        """
+        self._model_file = model_file or self.default_model_file
+
+    @property
+    def emission_factors(self):
+        """Mapping of component type to emission factor. Loads the model file on first access."""
+        self._ensure_loaded()
+        return self._emission_factors
+
+    @emission_factors.setter
+    def emission_factors(self, emission_factors):
+        self._ensure_loaded()
+        self._emission_factors = FactorTable(emission_factors)
+        self._build_tables()
+
+    def _load(self):
+        """Loads the model file and builds the factor tables."""
+        self._emission_factors = FactorTable(self._load_factors())
+        self._build_tables()
+
+    def _sync_tables(self):
+        """Loads the model file if needed and rebuilds the factor tables if emission_factors changed."""
+        self._ensure_loaded()
+        if self._emission_factors.version != self._tables_version:
+            self._build_tables()
+
+    def _build_tables(self):
+        """Builds the float factor tables from emission_factors."""
+        # Emission factors as plain kg CO2e / kg magnitudes for the get_carbon fast path, keyed by
+        # each type and by its raw string value, so callers holding the type string from BOM
+        # parsing can skip the enum construction
+        mag_per_kg = {t: f.m_as("kg/kg") for t, f in self._emission_factors.items()}
+        self._factors_by_any = {
+            **mag_per_kg,
+            **{t.value: f for t, f in mag_per_kg.items()},
+        }
+
+        # Factor magnitudes indexed by position in type_enum, for get_carbon_batch
+        generic = mag_per_kg.get(self.type_enum.GENERIC)
+        self._factor_vec = np.array(
+            [mag_per_kg.get(t, generic) for t in self.type_enum],
+            dtype=np.float64,
+        )
+        self._tables_version = self._emission_factors.version
+
+    def _load_factors(self) -> dict:
+        """
+        Builds the emission factor table from the model file. Parsing is skipped by load_yaml
+        when the file is unchanged since it was last loaded.
+
+        Returns:
+            dict: A new mapping of type_enum to emission factor.
+
+        Raises:
+            ModelConfigError: If the model file has no known entries or no generic emission factor
+        """
+        cls = type(self)
+        model_file = self._model_file
+        emission_factors = load_emission_factors(model_file, cls.type_enum)
+        generic = cls.type_enum.GENERIC
+
+        # Ensure we have at least a generic factor
+        if generic not in emission_factors:
+            if cls.generic_fallback in emission_factors:
+                emission_factors[generic] = emission_factors[cls.generic_fallback]
+            else:
+                raise ModelConfigError(f"No generic {cls.label} emission factor found in {model_file}.")
+
+        # Complete the table so every type resolves with a single lookup in get_carbon
+        for t in cls.type_enum:
+            if t not in emission_factors:
+                warn_once(f"{cls.label.capitalize()} type {t} not found in {model_file}. Using generic emission factor.")
+                emission_factors[t] = emission_factors[generic]
+        return emission_factors
+
+    def get_carbon(self, weight: units, component_type: Enum | str = None, n_components: int = 1) -> Carbon:
+        """
+        Calculates the carbon emissions for components based on weight and type.
+
+        Args:
+            weight: The weight of a single component
+            component_type: The type of component, as a type_enum member or its string value. Defaults to GENERIC
+            n_components: The number of components. Defaults to 1
+
+        Returns:
+            Carbon: The total carbon emissions for the components
+
+        Raises:
+            AssertionError: If the weight is not in units of mass
+        """
+        self._sync_tables()
+        assert weight.dimensionality == _KG_DIM, f"Expected weight units for {self.label} model but got {weight}"
+
+        if component_type is None:
+            component_type = self.type_enum.GENERIC
+
+        # Get the emission factor for this component type
+        emission_factor = self._factors_by_any.get(component_type)
+        if emission_factor is None:
+            warn_once(
+                f"{self.label.capitalize()} type {component_type} not found in {self._model_file}. Using generic emission factor.",
+                stacklevel=2,
+            )
+            emission_factor = self._factors_by_any[self.type_enum.GENERIC]
+
+        # Calculate carbon: weight × emission_factor × number of components
+        total_carbon = units.Quantity(
+            weight.m_as("kg") * emission_factor * n_components, "kg"
+        )
+
+        log.debug(
+            "%s carbon calculation: %s * %s kg CO2e/kg * %s = %s",
+            self.label.capitalize(), weight, emission_factor, n_components, total_carbon,
+            stacklevel=2,
+        )
+
+        return Carbon(total_carbon, self.source_type)
+
+    def get_carbon_batch(
+        self,
+        types: list,
+        weights_kg: np.ndarray,
+        counts: np.ndarray,
+    ) -> Carbon:
+        """
+        Calculates the total carbon emissions for many component rows at once.
+
+        Args:
+            types: The type of each row, as type_enum members or their string values
+            weights_kg: The weight of a single component in each row, in kg
+            counts: The number of components in each row
+
+        Returns:
+            Carbon: The summed carbon emissions over all rows
+
+        Raises:
+            KeyError: If a row's type is not a member of type_enum
+        """
+        self._sync_tables()
+        idx = enum_indices(self.type_enum, types)
+        total = float(
+            (np.asarray(weights_kg, dtype=np.float64) * self._factor_vec[idx] * np.asarray(counts)).sum()
+        )
+        return Carbon(units.Quantity(total, "kg"), self.source_type)
@@ -28,6 +28,13 @@ class BaseTestCase(unittest.TestCase):
         self.temp_dir = tempfile.TemporaryDirectory(prefix="act_out_")
         self.out_dir = self.temp_dir.name
 
+        # keep the parsed model file cache out of the user's cache directory
+        self.cache_home = tempfile.TemporaryDirectory(prefix="act_cache_")
+        self.addCleanup(self.cache_home.cleanup)
+        env = patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache_home.name})
+        env.start()
+        self.addCleanup(env.stop)
+
         self.test_dir = os.path.abspath(os.path.dirname(__file__))
         self.test_args = ["./act"]
         self.boms_dir = f"{self.test_dir}/../boms/"
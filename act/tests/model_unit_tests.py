@@ -3,6 +3,13 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import copy
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
 from .base_test_case import BaseTestCase
 from ..core.common import *
 from ..core.capacitor_model import (
@@ -18,7 +25,16 @@ from ..core.dram_model import DRAMModel
 from ..core.hdd_model import HDDModel
 from ..core.materials_model import MaterialsModel
 from ..core.pcb_model import PCBModel
+from ..core import _model_loader
+from ..core._model_loader import load_emission_factors, shared_model
+from ..core.active_model import ActiveModel, ActiveType
+from ..core.connector_model import ConnectorModel, ConnectorType
+from ..core.diode_model import DiodeModel, DiodeType
+from ..core.inductor_model import InductorModel, InductorType
+from ..core.other_model import OtherModel, OtherType
+from ..core.resistor_model import ResistorModel, ResistorType
 from ..core.ssd_model import SSDModel
+from ..core.switch_model import SwitchModel
 
 
 class ModelUnitTests(BaseTestCase):
@@ -27,6 +43,35 @@ class ModelUnitTests(BaseTestCase):
     def setUp(self):
         super().setUp()
 
+    def test_logic_model_copy(self):
+        """The logic model survives a deep copy and a pickle round trip"""
+        model = self.act_model.logic_model
+        for clone in (copy.deepcopy(model), pickle.loads(pickle.dumps(model))):
+            self.assertEqual(clone.ci_model, model.ci_model)
+            self.assertEqual(clone.world_cpa_model, model.world_cpa_model)
+
+    def test_passive_models_pickle(self):
+        """Lazily loaded passive models survive a pickle round trip before and after loading"""
+        weight = 0.4 * g
+        for model, query in [
+            (ActiveModel(), lambda m: m.get_carbon(weight, ActiveType.TRANSISTOR_BJT, 3)),
+            (ConnectorModel(), lambda m: m.get_carbon(weight, ConnectorType.PCI, 2)),
+            (DiodeModel(), lambda m: m.get_carbon(weight, DiodeType.LED, 5)),
+            (OtherModel(), lambda m: m.get_carbon(weight, OtherType.PASSIVE_GENERIC, 1)),
+            (InductorModel(), lambda m: m.get_carbon(4, InductorType.PKG_0402)),
+        ]:
+            unloaded = pickle.loads(pickle.dumps(model))
+            expected = query(model)
+            loaded = pickle.loads(pickle.dumps(model))
+            for clone in (unloaded, loaded, copy.deepcopy(model)):
+                self.assertAlmostEqual(query(clone).total(), expected.total())
+
+    def test_act_model_deepcopy(self):
+        """The full ACT model can be deep copied"""
+        clone = copy.deepcopy(self.act_model)
+        self.assertIsNot(clone.cap_model, self.act_model.cap_model)
+        self.assertIsNot(clone.active_model, self.act_model.active_model)
+
     def test_logic_model(self):
         """Basic unit to spot check the logic carbon calculation result"""
         fab_yield = 0.943543
@@ -173,3 +218,257 @@ class ModelUnitTests(BaseTestCase):
         expected = 0.13 * kg / m2 * layers * area
         self.assertAlmostEqual(result.total(), expected)
         self.assertEqual(result.types(), [SourceType.FABRICATION])
+
+    def test_active_model_string_type(self):
+        """Active model accepts the raw type string in place of the enum"""
+        model = ActiveModel()
+        weight = 0.4 * g
+        for active_type in ActiveType:
+            self.assertAlmostEqual(
+                model.get_carbon(weight, active_type.value, 2).total(),
+                model.get_carbon(weight, active_type, 2).total(),
+            )
+
+    def test_resistor_model_string_type(self):
+        """Resistor model accepts the raw package string in place of the enum"""
+        model = ResistorModel()
+        for resistor_type in ResistorType:
+            self.assertAlmostEqual(
+                model.get_carbon(5, resistor_type.value).total(),
+                model.get_carbon(5, resistor_type).total(),
+            )
+
+    def test_emission_factors_writable(self):
+        """Changes to the public emission factor tables are used by get_carbon and get_carbon_batch"""
+        active = ActiveModel()
+        active.emission_factors[ActiveType.TRANSISTOR_BJT] = 2 * kg / kg
+        self.assertAlmostEqual(active.get_carbon(1 * kg, ActiveType.TRANSISTOR_BJT).total(), 2 * kg)
+        active.emission_factors = {ActiveType.GENERIC: 3 * kg / kg}
+        self.assertAlmostEqual(
+            active.get_carbon_batch([ActiveType.TRANSISTOR_BJT], [1.0], [1]).total(), 3 * kg
+        )
+
+        resistor = ResistorModel()
+        resistor.emission_factors[ResistorType.PKG_0402] = 0.5 * kg
+        self.assertAlmostEqual(resistor.get_carbon(2, ResistorType.PKG_0402).total(), 1 * kg)
+        self.assertAlmostEqual(
+            resistor.get_carbon_batch([ResistorType.PKG_0402], None, [2]).total(), 1 * kg
+        )
+
+        inductor = InductorModel()
+        inductor.package_emission_factors[InductorType.PKG_0402] = 0.5 * kg
+        self.assertAlmostEqual(
+            inductor.get_carbon_batch([InductorType.PKG_0402], None, [2]).total(), 1 * kg
+        )
+
+        capacitor = CapacitorModel()
+        ci = EnergyLocation.KOREA
+        capacitor.get_carbon(ci, CapacitorType.PKG_0402, 0.01 * g, 2)
+        capacitor.package_model[CapacitorType.PKG_0402] = 0.5 * kg
+        self.assertAlmostEqual(capacitor.get_carbon(ci, CapacitorType.PKG_0402, 0.01 * g, 2).total(), 1 * kg)
+        self.assertAlmostEqual(
+            capacitor.get_carbon_batch([CapacitorType.PKG_0402], [1e-5], [2], ci=ci).total(), 1 * kg
+        )
+
+        for clone in (pickle.loads(pickle.dumps(resistor)), copy.deepcopy(resistor)):
+            clone.emission_factors[ResistorType.PKG_0402] = 1 * kg
+            self.assertAlmostEqual(clone.get_carbon(2, ResistorType.PKG_0402).total(), 2 * kg)
+        self.assertAlmostEqual(resistor.get_carbon(2, ResistorType.PKG_0402).total(), 1 * kg)
+
+    def _model_file(self, text):
+        """Writes a model file with the given contents to a temporary directory and returns its path"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "model.yaml")
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_model_file_without_known_keys(self):
+        """Model files with no recognized entries raise ModelConfigError"""
+        model_file = self._model_file("bogus: 1 kg / kg\n")
+        with self.assertRaises(ModelConfigError):
+            ActiveModel(model_file).get_carbon(1 * g)
+        with self.assertRaises(ModelConfigError):
+            ResistorModel(model_file)
+
+    def test_model_file_without_generic(self):
+        """Model files with no generic factor and no fallback raise ModelConfigError"""
+        with self.assertRaises(ModelConfigError):
+            ConnectorModel(self._model_file("pci: 112 kg / kg\n")).get_carbon(1 * g)
+        with self.assertRaises(ModelConfigError):
+            SwitchModel(self._model_file("toggle: 50 kg / kg\n"))
+
+    def test_missing_type_warned_per_model_file(self):
+        """Types missing from the model file are warned about once for each model file"""
+        for _ in range(2):
+            model_file = self._model_file("generic: 1 kg / kg\n")
+            with self.assertLogs("ACT", level="WARNING") as logs:
+                ActiveModel(model_file).get_carbon(1 * g)
+            self.assertTrue(any(model_file in line for line in logs.output))
+
+    def test_weight_based_models_log_module(self):
+        """Weight-based model log records name the subclass's module"""
+        for model, module in [
+            (ActiveModel(), "active_model"),
+            (ConnectorModel(), "connector_model"),
+            (DiodeModel(), "diode_model"),
+            (OtherModel(), "other_model"),
+        ]:
+            model.emission_factors  # load first, so load-time records are not captured
+            with self.assertLogs("ACT", level="DEBUG") as logs:
+                model.get_carbon(1 * g, "not_a_type")
+            self.assertEqual({r.module for r in logs.records}, {module})
+
+    def test_load_emission_factors_required(self):
+        """Model files missing the required entry raise ModelConfigError"""
+        model_file = self._model_file('"0402": 0.001 kg\n')
+        self.assertEqual(list(load_emission_factors(model_file, ResistorType)), [ResistorType.PKG_0402])
+        with self.assertRaises(ModelConfigError):
+            load_emission_factors(model_file, ResistorType, required=ResistorType.GENERIC)
+
+    def test_pcb_model_unregistered_layers(self):
+        """PCB layer counts without a model entry or cpla default raise ModelConfigError"""
+        model = PCBModel(self._model_file("2: 0.41 kg / m2\n"))
+        self.assertAlmostEqual(model.get_carbon(1 * m2, 2).total(), 0.41 * kg)
+        with self.assertRaises(ModelConfigError):
+            model.get_carbon(1 * m2, 6)
+
+    def test_shared_model_replaced_on_change(self):
+        """Shared models are reused until their file changes, then replaced"""
+        model_file = self._model_file('"0402": 0.001 kg\n')
+        self.addCleanup(_model_loader._shared_models.pop, (ResistorModel, model_file), None)
+        first = shared_model(ResistorModel, model_file)
+        self.assertIs(shared_model(ResistorModel, model_file), first)
+
+        with open(model_file, "w") as f:
+            f.write('"0402": 0.002 kg\n')
+        stat = os.stat(model_file)
+        os.utime(model_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = shared_model(ResistorModel, model_file)
+        self.assertIsNot(second, first)
+        self.assertAlmostEqual(second.get_carbon(1, ResistorType.PKG_0402).total(), 0.002 * kg)
+        self.assertEqual(
+            [m for (_, path), (_, m) in _model_loader._shared_models.items() if path == model_file],
+            [second],
+        )
+
+    def test_model_file_rewritten_with_same_mtime(self):
+        """Models built after a model file is rewritten with the same mtime use the new factors"""
+        model_file = self._model_file("generic: 10 kg / kg\n")
+        self.addCleanup(_model_loader._shared_models.pop, (SwitchModel, model_file), None)
+        mtime_ns = os.stat(model_file).st_mtime_ns
+        self.assertAlmostEqual(ActiveModel(model_file).get_carbon(1 * kg).total(), 10 * kg)
+        self.assertAlmostEqual(shared_model(SwitchModel, model_file).get_carbon(1 * kg).total(), 10 * kg)
+
+        with open(model_file, "w") as f:
+            f.write("generic: 1000 kg / kg\n")
+        os.utime(model_file, ns=(mtime_ns, mtime_ns))
+        self.assertAlmostEqual(ActiveModel(model_file).get_carbon(1 * kg).total(), 1000 * kg)
+        self.assertAlmostEqual(shared_model(SwitchModel, model_file).get_carbon(1 * kg).total(), 1000 * kg)
+
+    def test_resistor_model_batch(self):
+        """Batch resistor model results match the sum of per-row results"""
+        model = ResistorModel()
+        rows = [
+            (12, ResistorType.PKG_0201),
+            (3, "0603"),
+            (40, ResistorType.GENERIC),
+        ]
+        expected = sum(model.get_carbon(n, t) for n, t in rows)
+        result = model.get_carbon_batch(
+            types=[t for _, t in rows],
+            weights_kg=None,
+            counts=[n for n, _ in rows],
+        )
+        self.assertEqual(result.types(), [SourceType.RESISTOR])
+        self.assertAlmostEqual(result.total(), expected.total())
+
+    def test_active_model_batch(self):
+        """Batch active model results match the sum of per-component results"""
+        model = ActiveModel()
+        rows = [
+            (0.2 * g, ActiveType.TRANSISTOR_BJT, 3),
+            (1.5 * g, "transistor_mosfet", 1),
+            (0.7 * g, ActiveType.GENERIC, 10),
+        ]
+        expected = sum(model.get_carbon(w, t, n) for w, t, n in rows)
+        result = model.get_carbon_batch(
+            types=[t for _, t, _ in rows],
+            weights_kg=[w.m_as("kg") for w, _, _ in rows],
+            counts=[n for _, _, n in rows],
+        )
+        self.assertEqual(result.types(), [SourceType.ACTIVE])
+        self.assertAlmostEqual(result.total(), expected.total())
+
+    def test_inductor_model_batch(self):
+        """Batch inductor model results match the sum of per-row results"""
+        model = InductorModel()
+        rows = [
+            (InductorType.PKG_0402, 6),
+            ("0805", 2),
+            (InductorType.GENERIC, 1),
+        ]
+        expected = sum(model.get_carbon(n, t) for t, n in rows)
+        result = model.get_carbon_batch(
+            types=[t for t, _ in rows],
+            weights_kg=None,
+            counts=[n for _, n in rows],
+        )
+        self.assertEqual(result.types(), [SourceType.INDUCTOR])
+        self.assertAlmostEqual(result.total(), expected.total())
+
+    def test_capacitor_model_copy(self):
+        """Copied and unpickled capacitor models compute with their own state"""
+        model = CapacitorModel()
+        ci = EnergyLocation.KOREA
+        expected = model.get_carbon(ci, CapacitorType.MLCC, 0.03 * g, 4).total()
+        for clone in (copy.deepcopy(model), pickle.loads(pickle.dumps(model))):
+            self.assertEqual(clone._carbon_memo, {})
+            self.assertIsNot(clone._dispatch, model._dispatch)
+            self.assertAlmostEqual(
+                clone.get_carbon(ci, CapacitorType.MLCC, 0.03 * g, 4).total(), expected
+            )
+
+    def test_capacitor_model_package_without_weight(self):
+        """Package-based and fallback capacitor types do not need a weight"""
+        model = CapacitorModel()
+        ci = EnergyLocation.JAPAN
+        self.assertAlmostEqual(
+            model.get_carbon(ci, CapacitorType.PKG_0402, None, 5).total(),
+            model.package_model[CapacitorType.PKG_0402] * 5,
+        )
+        self.assertAlmostEqual(
+            model.get_carbon(ci, CapacitorType.PKG_0402, 1 * mm2, 5).total(),
+            model.package_model[CapacitorType.PKG_0402] * 5,
+        )
+
+    def test_capacitor_model_array_weight(self):
+        """Array-valued capacitor weights are computed elementwise"""
+        model = CapacitorModel()
+        ci = EnergyLocation.KOREA
+        weights = [0.01, 0.03]
+        result = model.get_carbon(ci, CapacitorType.MLCC, np.array(weights) * g, 2).total()
+        for i, w in enumerate(weights):
+            self.assertAlmostEqual(
+                result[i], model.get_carbon(ci, CapacitorType.MLCC, w * g, 2).total()
+            )
+
+    def test_capacitor_model_batch(self):
+        """Batch capacitor model results match the sum of per-capacitor results"""
+        model = CapacitorModel()
+        ci = EnergyLocation.KOREA
+        rows = [
+            (CapacitorType.MLCC, 0.03 * g, 4),
+            (CapacitorType.PKG_0402, 0.01 * g, 20),
+            ("tec", 0.02 * g, 5),
+            (CapacitorType.GENERIC, 0.03 * g, 2),
+        ]
+        expected = sum(model.get_carbon(ci, t, w, n) for t, w, n in rows)
+        result = model.get_carbon_batch(
+            types=[t for t, _, _ in rows],
+            weights_kg=[w.m_as("kg") for _, w, _ in rows],
+            counts=[n for _, _, n in rows],
+            ci=ci,
+        )
+        self.assertAlmostEqual(result.total(), expected.total())
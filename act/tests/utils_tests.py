@@ -3,7 +3,14 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
 from ..core.utils import *
+from ..core.utils import _load_model_cached, _model_cache_path
 from ..core.units import mm2
 
 
@@ -26,3 +33,80 @@ class UtilsTests:
                 self.assertTrue(0 <= mr <= 1)
                 e = exponential_model(area=a, density=d)
                 self.assertTrue(0 <= e <= 1)
+
+
+class ModelCacheTests(unittest.TestCase):
+    """Tests over the JSON cache of parsed YAML model files"""
+
+    def setUp(self):
+        self.model_dir = tempfile.TemporaryDirectory(prefix="act_models_")
+        self.cache_home = tempfile.TemporaryDirectory(prefix="act_cache_")
+        self.addCleanup(self.model_dir.cleanup)
+        self.addCleanup(self.cache_home.cleanup)
+        env = patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache_home.name})
+        env.start()
+        self.addCleanup(env.stop)
+        self.model_file = os.path.join(self.model_dir.name, "model.yaml")
+
+    def write_model(self, text, mtime_ns=None):
+        with open(self.model_file, "w") as handle:
+            handle.write(text)
+        if mtime_ns is not None:
+            os.utime(self.model_file, ns=(mtime_ns, mtime_ns))
+
+    def test_cache_hit(self):
+        """A matching cache entry is served without parsing the YAML file"""
+        self.write_model("generic: 10\n")
+        self.assertEqual(_load_model_cached(self.model_file), {"generic": 10})
+
+        cache_path = _model_cache_path(self.model_file)
+        self.assertTrue(cache_path.startswith(self.cache_home.name))
+        self.assertEqual(os.listdir(self.model_dir.name), ["model.yaml"])
+
+    def test_cache_disabled(self):
+        """Setting the opt-out variable neither reads nor writes the cache"""
+        self.write_model("generic: 10\n")
+        with patch.dict(os.environ, {NO_MODEL_CACHE_ENV: "1"}):
+            self.assertEqual(_load_model_cached(self.model_file), {"generic": 10})
+        self.assertEqual(os.listdir(self.cache_home.name), [])
+
+        # tag the cached data so a hit is distinguishable from a re-parse
+        with open(cache_path) as handle:
+            cached = json.load(handle)
+        cached["data"] = {"generic": "cached"}
+        with open(cache_path, "w") as handle:
+            json.dump(cached, handle)
+        self.assertEqual(_load_model_cached(self.model_file), {"generic": "cached"})
+
+    def test_cache_invalidated_by_older_file(self):
+        """A replaced model file is re-parsed even if its modification time is older"""
+        self.write_model("generic: 10\n", mtime_ns=2_000_000_000_000_000_000)
+        self.assertEqual(load_yaml(self.model_file), {"generic": 10})
+
+        self.write_model("generic: 99\n", mtime_ns=1_000_000_000_000_000_000)
+        self.assertEqual(load_yaml(self.model_file), {"generic": 99})
+
+    def test_cache_invalidated_by_size(self):
+        """A model file rewritten with the same modification time is re-parsed"""
+        self.write_model("generic: 10\n", mtime_ns=1_000_000_000_000_000_000)
+        self.assertEqual(_load_model_cached(self.model_file), {"generic": 10})
+
+        self.write_model("generic: 1000\n", mtime_ns=1_000_000_000_000_000_000)
+        self.assertEqual(_load_model_cached(self.model_file), {"generic": 1000})
+
+    def test_unwritable_cache_dir(self):
+        """Model files still load, and nothing is written beside them, if the cache dir is unusable"""
+        blocker = os.path.join(self.cache_home.name, "not_a_dir")
+        with open(blocker, "w"):
+            pass
+        self.write_model("generic: 10\n")
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": blocker}):
+            self.assertEqual(_load_model_cached(self.model_file), {"generic": 10})
+        self.assertEqual(os.listdir(self.model_dir.name), ["model.yaml"])
+
+    def test_cache_disabled(self):
+        """Setting the opt-out variable neither reads nor writes the cache"""
+        self.write_model("generic: 10\n")
+        with patch.dict(os.environ, {NO_MODEL_CACHE_ENV: "1"}):
+            self.assertEqual(_load_model_cached(self.model_file), {"generic": 10})
+        self.assertEqual(os.listdir(self.cache_home.name), [])